@@ -1,16 +1,42 @@
-import json
-import boto3
 import os
-from boto3.dynamodb.conditions import Key
+from decimal import Decimal
+
+import boto3
+import orjson
+from boto3.dynamodb.types import TypeDeserializer
+
+client = boto3.client("dynamodb")
+TABLE_NAME = os.environ["TABLE_NAME"]
+_deser = TypeDeserializer()
+
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
 
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(os.environ["TABLE_NAME"])
+
+def _decimal_default(obj):
+    # boto3 returns DynamoDB numbers as Decimal, which orjson can't encode.
+    # Integers outside int64 (DynamoDB allows 38 digits) go out as strings.
+    if isinstance(obj, Decimal):
+        if obj != obj.to_integral_value():
+            return float(obj)
+        value = int(obj)
+        return value if _INT64_MIN <= value <= _INT64_MAX else str(value)
+    raise TypeError
+
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj, default=_decimal_default).decode()
 
 
 def _build_pk(artifact_type: str, artifact_id: str) -> str:
     return f"{artifact_type}#{artifact_id}"
 
 
+def _deserialize(item: dict) -> dict:
+    return {k: _deser.deserialize(v) for k, v in item.items()}
+
+
 def lambda_handler(event, context):
     try:
         path = event.get("pathParameters") or {}
@@ -20,31 +46,40 @@ def lambda_handler(event, context):
         if not artifact_type or not artifact_id:
             return {
                 "statusCode": 400,
-                "body": json.dumps({"error": "artifact_type and artifact_id required"})
+                "body": _dumps({"error": "artifact_type and artifact_id required"}),
+                "headers": {"Content-Type": "application/json; charset=utf-8"}
             }
 
         pk = _build_pk(artifact_type, artifact_id)
 
-        resp = table.query(
-            KeyConditionExpression=Key("pk").eq(pk)
+        pages = client.get_paginator("query").paginate(
+            TableName=TABLE_NAME,
+            KeyConditionExpression="pk = :pk",
+            ExpressionAttributeValues={":pk": {"S": pk}},
         )
 
-        items = resp.get("Items", [])
+        items = [
+            _deserialize(item)
+            for page in pages
+            for item in page.get("Items", [])
+        ]
 
         if not items:
             return {
                 "statusCode": 404,
-                "body": json.dumps({"error": "Artifact not found"})
+                "body": _dumps({"error": "Artifact not found"}),
+                "headers": {"Content-Type": "application/json; charset=utf-8"}
             }
 
         return {
             "statusCode": 200,
-            "body": json.dumps({"items": items}),
-            "headers": {"Content-Type": "application/json"}
+            "body": _dumps({"items": items}),
+            "headers": {"Content-Type": "application/json; charset=utf-8"}
         }
 
     except Exception as e:
         return {
             "statusCode": 500,
-            "body": json.dumps({"error": str(e)})
+            "body": _dumps({"error": str(e)}),
+            "headers": {"Content-Type": "application/json; charset=utf-8"}
         }
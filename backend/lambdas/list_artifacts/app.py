@@ -1,17 +1,44 @@
-import json
 import os
+from decimal import Decimal
 
 import boto3
-from boto3.dynamodb.conditions import Key
+import orjson
+from boto3.dynamodb.types import TypeDeserializer
 
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(os.environ["TABLE_NAME"])
+client = boto3.client("dynamodb")
+TABLE_NAME = os.environ["TABLE_NAME"]
+_deser = TypeDeserializer()
+
+TYPE_INDEX = "by_type"
+
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _decimal_default(obj):
+    # boto3 returns DynamoDB numbers as Decimal, which orjson can't encode.
+    # Integers outside int64 (DynamoDB allows 38 digits) go out as strings.
+    if isinstance(obj, Decimal):
+        if obj != obj.to_integral_value():
+            return float(obj)
+        value = int(obj)
+        return value if _INT64_MIN <= value <= _INT64_MAX else str(value)
+    raise TypeError
+
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj, default=_decimal_default).decode()
 
 
 def _build_pk(artifact_type: str, artifact_id: str) -> str:
     return f"{artifact_type}#{artifact_id}"
 
 
+def _deserialize(item: dict) -> dict:
+    return {k: _deser.deserialize(v) for k, v in item.items()}
+
+
 def lambda_handler(event, context):
     try:
         path_params = event.get("pathParameters") or {}
@@ -21,45 +48,61 @@ def lambda_handler(event, context):
         if not artifact_type:
             return {
                 "statusCode": 400,
-                "body": json.dumps({"error": "artifact_type is required"}),
+                "body": _dumps({"error": "artifact_type is required"}),
+                "headers": {"Content-Type": "application/json; charset=utf-8"},
             }
 
         # Case 1: GET /artifacts/{artifact_type}
         if artifact_id is None:
-            # Scan by begins_with on pk (since type is prefix)
-            resp = table.scan(
-                FilterExpression=Key("pk").begins_with(f"{artifact_type}#")
+            # Query the by_type GSI instead of scanning the whole table
+            pages = client.get_paginator("query").paginate(
+                TableName=TABLE_NAME,
+                IndexName=TYPE_INDEX,
+                KeyConditionExpression="artifact_type = :t",
+                ExpressionAttributeValues={":t": {"S": artifact_type}},
             )
-            items = resp.get("Items", [])
+            items = [
+                _deserialize(item)
+                for page in pages
+                for item in page.get("Items", [])
+            ]
 
             return {
                 "statusCode": 200,
-                "body": json.dumps({"items": items}),
-                "headers": {"Content-Type": "application/json"},
+                "body": _dumps({"items": items}),
+                "headers": {"Content-Type": "application/json; charset=utf-8"},
             }
 
         # Case 2: GET /artifacts/{artifact_type}/{artifact_id}
         pk = _build_pk(artifact_type, artifact_id)
-        resp = table.query(KeyConditionExpression=Key("pk").eq(pk))
-        items = resp.get("Items", [])
+        pages = client.get_paginator("query").paginate(
+            TableName=TABLE_NAME,
+            KeyConditionExpression="pk = :pk",
+            ExpressionAttributeValues={":pk": {"S": pk}},
+        )
+        items = [
+            _deserialize(item)
+            for page in pages
+            for item in page.get("Items", [])
+        ]
 
         if not items:
             return {
                 "statusCode": 404,
-                "body": json.dumps({"error": "Artifact not found"}),
-                "headers": {"Content-Type": "application/json"},
+                "body": _dumps({"error": "Artifact not found"}),
+                "headers": {"Content-Type": "application/json; charset=utf-8"},
             }
 
         # Option: return all versions; autograder usually just checks non-empty
         return {
             "statusCode": 200,
-            "body": json.dumps({"items": items}),
-            "headers": {"Content-Type": "application/json"},
+            "body": _dumps({"items": items}),
+            "headers": {"Content-Type": "application/json; charset=utf-8"},
         }
 
     except Exception as e:
         return {
             "statusCode": 500,
-            "body": json.dumps({"error": str(e)}),
-            "headers": {"Content-Type": "application/json"},
+            "body": _dumps({"error": str(e)}),
+            "headers": {"Content-Type": "application/json; charset=utf-8"},
         }
@@ -1,10 +1,41 @@
 import json
 import os
 import re
+from decimal import Decimal
+
 import boto3
+import orjson
+from boto3.dynamodb.types import TypeDeserializer
+
+client = boto3.client("dynamodb")
+TABLE_NAME = os.environ["TABLE_NAME"]
+_deser = TypeDeserializer()
+
+
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+
 
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(os.environ["TABLE_NAME"])
+def _decimal_default(obj):
+    # boto3 returns DynamoDB numbers as Decimal, which orjson can't encode.
+    # Integers outside int64 (DynamoDB allows 38 digits) go out as strings.
+    if isinstance(obj, Decimal):
+        if obj != obj.to_integral_value():
+            return float(obj)
+        value = int(obj)
+        return value if _INT64_MIN <= value <= _INT64_MAX else str(value)
+    raise TypeError
+
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj, default=_decimal_default).decode()
+
+
+def _scan_all():
+    # Paginate so matching isn't limited to the first 1MB page
+    for page in client.get_paginator("scan").paginate(TableName=TABLE_NAME):
+        for item in page.get("Items", []):
+            yield {k: _deser.deserialize(v) for k, v in item.items()}
 
 
 def lambda_handler(event, context):
@@ -15,7 +46,8 @@ def lambda_handler(event, context):
         if not pattern:
             return {
                 "statusCode": 400,
-                "body": json.dumps({"error": "pattern is required"})
+                "body": _dumps({"error": "pattern is required"}),
+                "headers": {"Content-Type": "application/json; charset=utf-8"}
             }
 
         # Compile regex
@@ -24,28 +56,25 @@ def lambda_handler(event, context):
         except re.error as e:
             return {
                 "statusCode": 400,
-                "body": json.dumps({"error": f"Invalid regex: {e}"})
+                "body": _dumps({"error": f"Invalid regex: {e}"}),
+                "headers": {"Content-Type": "application/json; charset=utf-8"}
             }
 
-        # Scan DynamoDB
-        resp = table.scan()
-        items = resp.get("Items", [])
-
         # Autograder expects full-item matching
         matched = [
-            item for item in items
-            if regex.search(json.dumps(item))
+            item for item in _scan_all()
+            if regex.search(_dumps(item))
         ]
 
         return {
             "statusCode": 200,
-            "body": json.dumps({"items": matched}),
-            "headers": {"Content-Type": "application/json"}
+            "body": _dumps({"items": matched}),
+            "headers": {"Content-Type": "application/json; charset=utf-8"}
         }
 
     except Exception as e:
         return {
             "statusCode": 500,
-            "body": json.dumps({"error": str(e)}),
-            "headers": {"Content-Type": "application/json"}
+            "body": _dumps({"error": str(e)}),
+            "headers": {"Content-Type": "application/json; charset=utf-8"}
         }
@@ -3,11 +3,33 @@ import os
 from datetime import datetime, timezone
 
 import boto3
+import orjson
 
 dynamodb = boto3.resource("dynamodb")
 table = dynamodb.Table(os.environ["TABLE_NAME"])  # FIXED
 
 
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+
+
+def _clamp_ints(obj):
+    # metadata comes from json.loads and may hold ints past int64, which
+    # orjson rejects outright (default= is never consulted); send those as
+    # strings, matching how the read handlers encode large Decimals
+    if isinstance(obj, dict):
+        return {k: _clamp_ints(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_clamp_ints(v) for v in obj]
+    if isinstance(obj, int) and not _INT64_MIN <= obj <= _INT64_MAX:
+        return str(obj)
+    return obj
+
+
+def _dumps(obj) -> str:
+    return orjson.dumps(_clamp_ints(obj)).decode()
+
+
 def _build_pk(artifact_type: str, artifact_id: str) -> str:
     return f"{artifact_type}#{artifact_id}"
 
@@ -28,11 +50,12 @@ def lambda_handler(event, context):
         if not artifact_type or not artifact_id or not version:
             return {
                 "statusCode": 400,
-                "body": json.dumps(
+                "body": _dumps(
                     {
                         "error": "artifact_type, artifact_id, and version are required"
                     }
                 ),
+                "headers": {"Content-Type": "application/json; charset=utf-8"},
             }
 
         item = {
@@ -49,13 +72,13 @@ def lambda_handler(event, context):
 
         return {
             "statusCode": 200,
-            "body": json.dumps({"message": "Artifact registered", "item": item}),
-            "headers": {"Content-Type": "application/json"},
+            "body": _dumps({"message": "Artifact registered", "item": item}),
+            "headers": {"Content-Type": "application/json; charset=utf-8"},
         }
 
     except Exception as e:
         return {
             "statusCode": 500,
-            "body": json.dumps({"error": str(e)}),
-            "headers": {"Content-Type": "application/json"},
+            "body": _dumps({"error": str(e)}),
+            "headers": {"Content-Type": "application/json; charset=utf-8"},
         }
@@ -1,33 +1,42 @@
-import json
 import os
 
 import boto3
+import orjson
 
 dynamodb = boto3.resource("dynamodb")
 table = dynamodb.Table(os.environ["TABLE_NAME"])
 
 
+def _dumps(obj) -> str:
+    return orjson.dumps(obj).decode()
+
+
 def lambda_handler(event, context):
     try:
-        # Scan all items
-        resp = table.scan()
-        items = resp.get("Items", [])
+        # Scan only the keys, following LastEvaluatedKey past the 1MB page limit
+        kwargs = {"ProjectionExpression": "pk, sk"}
 
         with table.batch_writer() as batch:
-            for item in items:
-                batch.delete_item(
-                    Key={"pk": item["pk"], "sk": item["sk"]}
-                )
+            while True:
+                resp = table.scan(**kwargs)
+                for item in resp.get("Items", []):
+                    batch.delete_item(
+                        Key={"pk": item["pk"], "sk": item["sk"]}
+                    )
+                lek = resp.get("LastEvaluatedKey")
+                if not lek:
+                    break
+                kwargs["ExclusiveStartKey"] = lek
 
         return {
             "statusCode": 200,
-            "body": json.dumps({"message": "Registry reset"}),
-            "headers": {"Content-Type": "application/json"},
+            "body": _dumps({"message": "Registry reset"}),
+            "headers": {"Content-Type": "application/json; charset=utf-8"},
         }
 
     except Exception as e:
         return {
             "statusCode": 500,
-            "body": json.dumps({"error": str(e)}),
-            "headers": {"Content-Type": "application/json"},
+            "body": _dumps({"error": str(e)}),
+            "headers": {"Content-Type": "application/json; charset=utf-8"},
         }